@@ -5,23 +5,71 @@ import missionary_cannibal_a_star
 import missionary_cannibal_solver_bfs
 import missionary_cannibal_solver_dfs
 
-from flask import Flask, request
+from flask import Flask, Response, request
 from flask_cors import CORS, cross_origin
-import json
+import functools
+
+try:
+    import orjson as json
+except ImportError:  # orjson has no PyPy build
+    import json
 
 app = Flask(__name__)
 CORS(app)
 
+def _json_response(result):
+    return Response(json.dumps(result), mimetype='application/json')
+
+
 @app.route("/")
 def test():
     return "Server running"
 
 
+def _solve_cached(cached_solver, *args):
+    # Only hashable parameters can be cache keys; anything else (a list or
+    # object in the request) is solved directly, as it was before caching
+    try:
+        hash(args)
+    except TypeError:
+        return cached_solver.__wrapped__(*args)
+    return cached_solver(*args)
+
+
+@functools.lru_cache(maxsize=1024)
+def _solve_missionary_cannibal(solver, M_total, C_total, boat_capacity, M_left, C_left, M_right, C_right, boat_position):
+    # Solutions are a pure function of the parameters, so repeated requests are served from the cache.
+    # The returned dicts are shared between requests and must not be mutated.
+    if solver == "bfs":
+        return missionary_cannibal_solver_bfs.solve_missionaries_cannibals(M_total, C_total, boat_capacity, M_left, C_left, M_right, C_right, boat_position)
+    if solver == "dfs":
+        return missionary_cannibal_solver_dfs.solve_missionaries_cannibals(M_total, C_total, boat_capacity, M_left, C_left, M_right, C_right, boat_position)
+    if solver == "a_star":
+        return missionary_cannibal_a_star.solve_missionaries_cannibals(M_total, C_total, boat_capacity, M_left, C_left, M_right, C_right, boat_position)
+    if solver == "a_star_bidirectional":
+        return missionary_cannibal_a_star.solve_missionaries_cannibals(M_total, C_total, boat_capacity, M_left, C_left, M_right, C_right, boat_position, bidirectional=True)
+
+
+def _bank_key(bank):
+    # None tells the solvers to use their default bank, so it is passed through as is
+    return None if bank is None else tuple(tuple(p) for p in bank)
+
+
+@functools.lru_cache(maxsize=1024)
+def _solve_jealous_husband(solver, num_of_couples, boat_capacity, left_bank, right_bank, boat_position):
+    # Banks are passed as tuples of (gender, couple) tuples so the call is hashable.
+    if solver == "bfs":
+        return jealous_husbands_bfs.solve_jealous_husbands(N=num_of_couples, boat_capacity=boat_capacity, left=left_bank, right=right_bank, boat_pos=boat_position)
+    if solver == "dfs":
+        return jealous_husbands_dfs.solve_jealous_husbands(N=num_of_couples, boat_capacity=boat_capacity, left=left_bank, right=right_bank, boat_pos=boat_position)
+    if solver == "a_star":
+        return jealous_husbands_a_star.solve_jealous_husbands(N=num_of_couples, boat_capacity=boat_capacity, left=left_bank, right=right_bank, boat_pos=boat_position)
+
+
 @app.route("/missionary-cannibal", methods = ['POST'])
 @cross_origin()
 def missionary_cannibal():
     parameters = json.loads(request.data)
-    print(parameters)
     M_total = parameters["M_total"]
     C_total = parameters["C_total"]
     M_left = parameters["M_left"]
@@ -31,34 +79,27 @@ def missionary_cannibal():
     boat_position = parameters["boat_position"]
     boat_capacity = parameters["boat_capacity"]
     solver = parameters["solver"]
-    if solver == "bfs":
-        return json.dumps(missionary_cannibal_solver_bfs.solve_missionaries_cannibals(M_total, C_total, boat_capacity, M_left, C_left, M_right, C_right, boat_position))
-    if solver == "dfs":
-        return json.dumps(missionary_cannibal_solver_dfs.solve_missionaries_cannibals(M_total, C_total, boat_capacity, M_left, C_left, M_right, C_right, boat_position))
-    if solver == "a_star":
-        return json.dumps(missionary_cannibal_a_star.solve_missionaries_cannibals(M_total, C_total, boat_capacity, M_left, C_left, M_right, C_right, boat_position))
+    result = _solve_cached(_solve_missionary_cannibal, solver, M_total, C_total, boat_capacity, M_left, C_left, M_right, C_right, boat_position)
+    if result is not None:
+        return _json_response(result)
     
 
 @app.route("/jealous-husband", methods = ['POST'])
 @cross_origin()
 def jealous_husband():
     parameters = json.loads(request.data)
-    print(parameters)
     num_of_couples = parameters["num_of_couples"]
     boat_capacity = parameters["boat_capacity"]
     solver = parameters["solver"]
     stage = parameters["stage"]
-    left_bank = stage["left_bank"]
-    right_bank = stage["right_bank"]
+    left_bank = _bank_key(stage["left_bank"])
+    right_bank = _bank_key(stage["right_bank"])
     boat_position = stage["boat_position"]
-    if solver == "bfs":
-        return json.dumps(jealous_husbands_bfs.solve_jealous_husbands(N=num_of_couples, boat_capacity=boat_capacity, left=left_bank, right=right_bank, boat_pos=boat_position))
-    if solver == "dfs":
-        print(jealous_husbands_dfs.solve_jealous_husbands(N=num_of_couples, boat_capacity=boat_capacity, left=left_bank, right=right_bank, boat_pos=boat_position))
-        return json.dumps(jealous_husbands_dfs.solve_jealous_husbands(N=num_of_couples, boat_capacity=boat_capacity, left=left_bank, right=right_bank, boat_pos=boat_position))
-    if solver == "a_star":
-        return json.dumps(jealous_husbands_a_star.solve_jealous_husbands(N=num_of_couples, boat_capacity=boat_capacity, left=left_bank, right=right_bank, boat_pos=boat_position))
+    result = _solve_cached(_solve_jealous_husband, solver, num_of_couples, boat_capacity, left_bank, right_bank, boat_position)
+    if result is not None:
+        return _json_response(result)
  
 
 if __name__ == "__main__":
+    # Development server only; production runs under gunicorn (see gunicorn_conf.py)
     app.run(debug=False)
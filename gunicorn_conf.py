@@ -0,0 +1,15 @@
+import os
+
+# The solvers are CPU-bound Python, so parallelism comes from worker processes
+# (each with its own solver result cache); threads only overlap request I/O.
+# Size by the CPUs this process may run on, not the host's count; WEB_CONCURRENCY overrides.
+# sched_getaffinity is Linux-only, so other platforms fall back to the host's count.
+if hasattr(os, "sched_getaffinity"):
+    cpus = len(os.sched_getaffinity(0))
+else:
+    cpus = os.cpu_count() or 1
+
+bind = "0.0.0.0:5000"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2 * cpus + 1))
+worker_class = "gthread"
+threads = 4
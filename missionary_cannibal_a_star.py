@@ -1,117 +1,517 @@
-import heapq
-import math
+import array
+import functools
 
-def is_valid_state(M_left, C_left, M_right, C_right, M_total, C_total):
-    # Check invalid counts
-    if M_left < 0 or C_left < 0 or M_right < 0 or C_right < 0:
-        return False
-    if M_left > M_total or C_left > C_total or M_right > M_total or C_right > C_total:
-        return False
-    
-    # Check missionary constraint
-    if M_left > 0 and C_left > M_left:
-        return False
-    if M_right > 0 and C_right > M_right:
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # e.g. PyPy, which numba does not support
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        # Leave the kernel as plain Python and let the interpreter's JIT handle it
+        return lambda fn: fn
+
+try:
+    # Optional ahead-of-time build of the A* kernel, see missionary_cannibal_a_star_kernel.pyx
+    from missionary_cannibal_a_star_kernel import astar_kernel as _astar_cython
+except ImportError:
+    _astar_cython = None
+
+BOAT_SIDES = ('left', 'right')
+
+@njit(cache=True)
+def is_valid_state(M_left, C_left, M_total, C_total):
+    # Check invalid counts; the right bank is whoever is not on the left
+    if M_left < 0 or C_left < 0 or M_left > M_total or C_left > C_total:
         return False
-    
-    return True
+    M_right = M_total - M_left
+    C_right = C_total - C_left
 
+    # Missionaries can't be outnumbered on either bank
+    return (M_left == 0 or C_left <= M_left) and (M_right == 0 or C_right <= M_right)
+
+@functools.lru_cache(maxsize=None)
 def get_possible_moves(boat_capacity):
-    moves = []
-    for i in range(boat_capacity + 1):   # i missionaries
-        for j in range(boat_capacity + 1):  # j cannibals
-            if i + j <= boat_capacity and i + j > 0:
-                moves.append((i, j))
-    return moves
+    """
+    All (missionaries, cannibals) boat loads with 1 <= i + j <= boat_capacity.
+    Only depends on boat_capacity, so it is built once and cached.
+    """
+    return tuple((i, j)
+                 for i in range(boat_capacity + 1)        # i missionaries
+                 for j in range(1 if i == 0 else 0, boat_capacity - i + 1))  # j cannibals
+
+@functools.lru_cache(maxsize=None)
+def get_move_deltas(boat_capacity):
+    """
+    Precomputed (dM_left, dC_left) for every move,
+    split by the bank the boat leaves from.
+    """
+    possible_moves = get_possible_moves(boat_capacity)
+    left_moves = tuple((-M_move, -C_move) for M_move, C_move in possible_moves)
+    right_moves = tuple((M_move, C_move) for M_move, C_move in possible_moves)
+    return left_moves, right_moves
+
+@functools.lru_cache(maxsize=None)
+def get_move_array(boat_capacity):
+    """
+    get_possible_moves as an int32 (num_moves, 2) array for the compiled search.
+    """
+    return np.array(get_possible_moves(boat_capacity), dtype=np.int32).reshape(-1, 2)
 
 def get_next_states(state, M_total, C_total, boat_capacity):
     """
     Generate all valid next states from the given state.
-    state = (M_left, C_left, M_right, C_right, boat_pos)
-    boat_pos in {'left', 'right'}
+    state = (M_left, C_left, boat_bit)
+    boat_bit is 0 when the boat is on the left, 1 when it is on the right.
     """
-    M_left, C_left, M_right, C_right, boat_pos = state
-    possible_moves = get_possible_moves(boat_capacity)
+    M_left, C_left, boat_bit = state
+    left_moves, right_moves = get_move_deltas(boat_capacity)
+    moves = right_moves if boat_bit else left_moves
+    new_boat_bit = 1 - boat_bit
+
     next_states = []
-    
-    if boat_pos == 'left':
-        for M_move, C_move in possible_moves:
-            new_M_left = M_left - M_move
-            new_C_left = C_left - C_move
-            new_M_right = M_right + M_move
-            new_C_right = C_right + C_move
-            if is_valid_state(new_M_left, new_C_left, new_M_right, new_C_right, M_total, C_total):
-                next_states.append((new_M_left, new_C_left, new_M_right, new_C_right, 'right'))
-    else:  # boat is on the right
-        for M_move, C_move in possible_moves:
-            new_M_left = M_left + M_move
-            new_C_left = C_left + C_move
-            new_M_right = M_right - M_move
-            new_C_right = C_right - C_move
-            if is_valid_state(new_M_left, new_C_left, new_M_right, new_C_right, M_total, C_total):
-                next_states.append((new_M_left, new_C_left, new_M_right, new_C_right, 'left'))
-    
+    for dM_left, dC_left in moves:
+        new_M_left = M_left + dM_left
+        new_C_left = C_left + dC_left
+        if is_valid_state(new_M_left, new_C_left, M_total, C_total):
+            next_states.append((new_M_left, new_C_left, new_boat_bit))
+
     return next_states
 
+@njit(cache=True)
 def heuristic(state, M_total, C_total):
     """
     Heuristic: a simple estimate of trips remaining.
-    h = ceil((M_left + C_left)/2)
+    h = ceil((M_left + C_left)/2), computed as (people_left + 1) >> 1
+    """
+    M_left, C_left, boat_bit = state
+    return (M_left + C_left + 1) >> 1
+
+@njit(cache=True)
+def heuristic_to(state, target):
+    """
+    heuristic towards an arbitrary target state, used by the backward half
+    of the bidirectional search (whose target is the start state).
+    h = ceil((|M_left - target_M_left| + |C_left - target_C_left|)/2)
+    """
+    people_apart = abs(state[0] - target[0]) + abs(state[1] - target[1])
+    return (people_apart + 1) >> 1
+
+@njit(cache=True)
+def pack_state(state, C_total):
+    """
+    Map (M_left, C_left, boat_bit) to a dense index in [0, num_states).
+    """
+    M_left, C_left, boat_bit = state
+    return (M_left * (C_total + 1) + C_left) * 2 + boat_bit
+
+@njit(cache=True)
+def unpack_state(idx, C_total):
+    """
+    Inverse of pack_state.
+    """
+    counts, boat_bit = divmod(idx, 2)
+    M_left, C_left = divmod(counts, C_total + 1)
+    return (M_left, C_left, boat_bit)
+
+# Scratch int buffers for the kernels. Compiled code wants NumPy arrays, but
+# plain Python indexes a list several times faster than a NumPy array
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _int_buffer(size, value):
+        return np.full(size, value, dtype=np.int32)
+
+    @njit(cache=True)
+    def _int_scratch(size):
+        # Contents undefined; left untouched, the pages are never faulted in
+        return np.empty(size, dtype=np.int32)
+
+    @njit(cache=True)
+    def _grow(arr):
+        bigger = np.empty(len(arr) * 2, dtype=arr.dtype)
+        bigger[:len(arr)] = arr
+        return bigger
+else:
+    def _int_buffer(size, value):
+        return [value] * size
+
+    def _int_scratch(size):
+        return [0] * size
+
+    def _grow(arr):
+        return arr * 2
+
+@njit(cache=True)
+def _astar_numba(M_total, C_total, boat_capacity, start_idx, goal_idx, moves_arr, visited, parent, g_cost):
+    """
+    Compiled A* over dense state indices.
+    f = g + h is a small non-negative integer, so the open list is a bucket
+    queue: one FIFO list per f value, linked through a pool of entries.
+    Closed states are never reopened; an open neighbor is only queued again
+    when it is reached with a smaller g than its best so far, which keeps
+    stale duplicates out of the buckets.
+    visited, parent and g_cost are caller-owned buffers of num_states
+    entries, initialised to 0, -1 and INT32_MAX; parent receives the parent
+    index of every reached state.
+    Returns:
+      num_traversed: Number of states popped from the open list.
+      found: Whether goal_idx was reached.
     """
-    M_left, C_left, M_right, C_right, boat_pos = state
-    people_left = M_left + C_left
-    return math.ceil(people_left / 2.0)
+    num_states = (M_total + 1) * (C_total + 1) * 2
+
+    # Every expanded state has g < num_states, so f never exceeds f_max
+    f_max = num_states + (M_total + C_total + 1) // 2
+    bucket_head = _int_buffer(f_max + 1, -1)
+    bucket_tail = _int_buffer(f_max + 1, -1)
+    entry_next = _int_scratch(num_states)
+    entry_g = _int_scratch(num_states)
+    entry_idx = _int_scratch(num_states)
+
+    stride = C_total + 1
+    num_moves = moves_arr.shape[0]
+    move_M = _int_scratch(num_moves)
+    move_C = _int_scratch(num_moves)
+    index_steps = _int_scratch(num_moves)
+    for k in range(num_moves):
+        move_M[k] = int(moves_arr[k, 0])
+        move_C[k] = int(moves_arr[k, 1])
+        # A move changes the dense index by a fixed amount: boat leaving the left bank
+        # gives nxt = current - index_steps[k], leaving the right gives current + index_steps[k]
+        index_steps[k] = (move_M[k] * stride + move_C[k]) * 2 - 1
+    start_f = heuristic(unpack_state(start_idx, C_total), M_total, C_total)
+    entry_next[0] = -1
+    entry_g[0] = 0
+    entry_idx[0] = start_idx
+    bucket_head[start_f] = 0
+    bucket_tail[start_f] = 0
+    num_entries = 1
+    num_open = 1
+    min_f = start_f
+    g_cost[start_idx] = 0
+    num_traversed = 0
+
+    while num_open > 0:
+        # Pop the oldest entry of the lowest non-empty bucket
+        while bucket_head[min_f] == -1:
+            min_f += 1
+        entry = bucket_head[min_f]
+        bucket_head[min_f] = entry_next[entry]
+        num_open -= 1
+        g = entry_g[entry]
+        current = entry_idx[entry]
+        num_traversed += 1
+
+        if visited[current]:
+            continue
+        visited[current] = 1
+
+        if current == goal_idx:
+            return num_traversed, True
+
+        # Explore neighbors, with unpack_state, is_valid_state and heuristic
+        # inlined on local ints and the successor index derived from current
+        boat_bit = current & 1
+        M_left, C_left = divmod(current >> 1, stride)
+        sign = 1 if boat_bit else -1
+        tentative_g = g + 1
+        for k in range(num_moves):
+            new_M_left = M_left + sign * move_M[k]
+            new_C_left = C_left + sign * move_C[k]
+            if new_M_left < 0 or new_C_left < 0 or new_M_left > M_total or new_C_left > C_total:
+                continue
+            if new_M_left != 0 and new_C_left > new_M_left:
+                continue
+            new_M_right = M_total - new_M_left
+            if new_M_right != 0 and C_total - new_C_left > new_M_right:
+                continue
+            nxt = current + sign * index_steps[k]
+            if visited[nxt] or tentative_g >= g_cost[nxt]:
+                continue
+            g_cost[nxt] = tentative_g
+            parent[nxt] = current
+            if nxt == goal_idx:
+                # Stop at generation instead of waiting to pop the goal. This is only
+                # guaranteed shortest while h never overestimates, i.e. boat_capacity <= 2;
+                # for larger boats ceil(people_left / 2) can overestimate, exactly as for
+                # the pop-time goal test
+                return num_traversed, True
+            f = tentative_g + ((new_M_left + new_C_left + 1) >> 1)
+
+            # Append to bucket f
+            if num_entries == len(entry_next):
+                entry_next = _grow(entry_next)
+                entry_g = _grow(entry_g)
+                entry_idx = _grow(entry_idx)
+            entry_next[num_entries] = -1
+            entry_g[num_entries] = tentative_g
+            entry_idx[num_entries] = nxt
+            if bucket_head[f] == -1:
+                bucket_head[f] = num_entries
+            else:
+                entry_next[bucket_tail[f]] = num_entries
+            bucket_tail[f] = num_entries
+            num_entries += 1
+            num_open += 1
+            # h is not consistent for boat_capacity > 2, so f can drop below the cursor
+            if f < min_f:
+                min_f = f
+
+    return num_traversed, False
 
 def astar_search(M_total, C_total, start_state, goal_state, boat_capacity):
     """
     A* search to find the shortest path from start_state to goal_state.
+    States are addressed by their dense index (see pack_state) and the
+    search itself runs in the Cython kernel when it is built, otherwise in
+    _astar_numba (compiled when numba is installed).
     Returns:
       path: The sequence of states from start to goal.
       num_traversed: Number of states traversed (popped from the priority queue).
     """
-    open_heap = []
-    g_cost = {start_state: 0}
-    parent = {start_state: None}
-    
-    start_h = heuristic(start_state, M_total, C_total)
-    heapq.heappush(open_heap, (start_h, 0, start_state))
-    visited = set()
-    num_traversed = 0  
+    M_left, C_left, boat_bit = start_state
+    if not (0 <= M_left <= M_total and 0 <= C_left <= C_total):
+        return None, 0
+
+    start = pack_state(start_state, C_total)
+    goal = pack_state(goal_state, C_total)
+    # The state space is small, so the closed lists are flat buffers rather
+    # than NumPy arrays; both index natively in PyPy and are accepted by numba
+    num_states = (M_total + 1) * (C_total + 1) * 2
+    visited = bytearray(num_states)
+    parent = array.array('i', [-1]) * num_states
+    g_cost = array.array('i', [np.iinfo(np.int32).max]) * num_states
+    kernel = _astar_cython if _astar_cython is not None else _astar_numba
+    num_traversed, found = kernel(M_total, C_total, boat_capacity, start, goal,
+                                  get_move_array(boat_capacity), visited, parent, g_cost)
+    if not found:
+        return None, num_traversed
+
+    # Reconstruct path
+    path = []
+    current = goal
+    while current != -1:
+        path.append(unpack_state(current, C_total))
+        current = int(parent[current])
+    path.reverse()
+    return path, num_traversed
+
+@njit(cache=True)
+def _astar_bidirectional_numba(M_total, C_total, boat_capacity, start_idx, goal_idx, moves_arr):
+    """
+    Compiled bidirectional A* over dense state indices.
+    Direction 0 searches from the start towards the goal, direction 1 from the
+    goal towards the start; moves are invertible, so both use the same successor
+    rule. Expansions alternate between the two bucket queues, which share one
+    entry pool. The search stops once the best meeting found is no longer than
+    the lowest f still open in either direction.
 
-    while open_heap:
-        f, g, current = heapq.heappop(open_heap)
-        num_traversed += 1  
+    Mirroring a state (swap the banks, flip the boat) maps index idx to
+    num_states - 1 - idx and preserves moves. When the start is the mirror of
+    the goal (everyone starting on the left), the backward search is exactly
+    the mirror image of the forward one, so only direction 0 runs and every
+    direction 1 lookup reads the mirrored state instead.
+    Returns:
+      parent: (2, num_states) parent index per direction, -1 for the roots/unreached.
+        When mirrored, only parent[0] is filled.
+      meet_fwd, meet_bwd: equal or adjacent states joining the two search trees.
+      mirrored: Whether the backward tree is the mirror of the forward one.
+      num_traversed: Number of states popped from both open lists.
+      found: Whether the two searches met.
+    """
+    num_states = (M_total + 1) * (C_total + 1) * 2
+    last = num_states - 1
+    mirrored = start_idx == last - goal_idx
+    parent = np.full((2, num_states), -1, dtype=np.int32)
+    closed = np.zeros((2, num_states), dtype=np.bool_)
+    closed_g = np.zeros((2, num_states), dtype=np.int32)
+    best_g = np.full((2, num_states), np.iinfo(np.int32).max, dtype=np.int32)
+
+    f_max = num_states + (M_total + C_total + 1) // 2
+    bucket_head = np.full((2, f_max + 1), -1, dtype=np.int32)
+    bucket_tail = np.full((2, f_max + 1), -1, dtype=np.int32)
+    entry_next = _int_scratch(num_states)
+    entry_g = _int_scratch(num_states)
+    entry_idx = _int_scratch(num_states)
+    entry_parent = _int_scratch(num_states)
+    num_open = np.zeros(2, dtype=np.int64)
+    min_f = np.zeros(2, dtype=np.int64)
+    top_f = np.zeros(2, dtype=np.int64)
+
+    start_state = unpack_state(start_idx, C_total)
+    goal_state = unpack_state(goal_idx, C_total)
+    for d in range(2):
+        root = start_idx if d == 0 else goal_idx
+        f = heuristic_to(start_state, goal_state) if d == 0 else heuristic_to(goal_state, start_state)
+        entry_next[d] = -1
+        entry_g[d] = 0
+        entry_idx[d] = root
+        entry_parent[d] = -1
+        bucket_head[d, f] = d
+        bucket_tail[d, f] = d
+        num_open[d] = 1
+        best_g[d, root] = 0
+        min_f[d] = f
+        top_f[d] = f
+    num_entries = 2
+
+    best = np.iinfo(np.int32).max
+    meet_fwd = -1
+    meet_bwd = -1
+    num_traversed = 0
+    d = 0 if mirrored else 1
 
-        if current in visited:
+    while num_open[0] > 0 and (mirrored or num_open[1] > 0):
+        if mirrored:
+            # h towards the start of a mirrored state equals its h towards the goal
+            if best <= top_f[0]:
+                break
+        else:
+            if best <= max(top_f[0], top_f[1]):
+                break
+            d = 1 - d
+
+        # Pop the oldest entry of the lowest non-empty bucket of direction d
+        while bucket_head[d, min_f[d]] == -1:
+            min_f[d] += 1
+        entry = bucket_head[d, min_f[d]]
+        bucket_head[d, min_f[d]] = entry_next[entry]
+        num_open[d] -= 1
+        top_f[d] = min_f[d]
+        g = entry_g[entry]
+        current = entry_idx[entry]
+        num_traversed += 1
+
+        if closed[d, current]:
             continue
-        visited.add(current)
-        
-        # Check if goal reached
-        if current == goal_state:
-            # Reconstruct path
-            path = []
-            while current is not None:
-                path.append(current)
-                current = parent[current]
-            path.reverse()
-            return path, num_traversed
-        
+        closed[d, current] = True
+        closed_g[d, current] = g
+        parent[d, current] = entry_parent[entry]
+        if mirrored:
+            other_d, other = 0, last - current
+        else:
+            other_d, other = 1 - d, current
+        if closed[other_d, other] and g + closed_g[other_d, other] < best:
+            best = g + closed_g[other_d, other]
+            meet_fwd = current
+            meet_bwd = current
+
         # Explore neighbors
-        for nxt in get_next_states(current, M_total, C_total, boat_capacity):
+        M_left, C_left, boat_bit = unpack_state(current, C_total)
+        sign = 1 if boat_bit else -1
+        for k in range(moves_arr.shape[0]):
+            new_M_left = M_left + sign * moves_arr[k, 0]
+            new_C_left = C_left + sign * moves_arr[k, 1]
+            if not is_valid_state(new_M_left, new_C_left, M_total, C_total):
+                continue
+            nxt_state = (new_M_left, new_C_left, 1 - boat_bit)
+            nxt = pack_state(nxt_state, C_total)
+            if closed[d, nxt]:
+                continue
             tentative_g = g + 1
-            if nxt not in g_cost or tentative_g < g_cost[nxt]:
-                g_cost[nxt] = tentative_g
-                parent[nxt] = current
-                h = heuristic(nxt, M_total, C_total)
-                f = tentative_g + h
-                heapq.heappush(open_heap, (f, tentative_g, nxt))
+            if mirrored:
+                other_d, other = 0, last - nxt
+            else:
+                other_d, other = 1 - d, nxt
+            if closed[other_d, other] and tentative_g + closed_g[other_d, other] < best:
+                best = tentative_g + closed_g[other_d, other]
+                if d == 0:
+                    meet_fwd = current
+                    meet_bwd = nxt
+                else:
+                    meet_fwd = nxt
+                    meet_bwd = current
+            # Only queue nxt again if this reaches it more cheaply
+            if tentative_g >= best_g[d, nxt]:
+                continue
+            best_g[d, nxt] = tentative_g
+            if d == 0:
+                f = tentative_g + heuristic_to(nxt_state, goal_state)
+            else:
+                f = tentative_g + heuristic_to(nxt_state, start_state)
+
+            # Append to bucket f of direction d
+            if num_entries == len(entry_next):
+                entry_next = _grow(entry_next)
+                entry_g = _grow(entry_g)
+                entry_idx = _grow(entry_idx)
+                entry_parent = _grow(entry_parent)
+            entry_next[num_entries] = -1
+            entry_g[num_entries] = tentative_g
+            entry_idx[num_entries] = nxt
+            entry_parent[num_entries] = current
+            if bucket_head[d, f] == -1:
+                bucket_head[d, f] = num_entries
+            else:
+                entry_next[bucket_tail[d, f]] = num_entries
+            bucket_tail[d, f] = num_entries
+            num_entries += 1
+            num_open[d] += 1
+            if f < min_f[d]:
+                min_f[d] = f
+
+    return parent, meet_fwd, meet_bwd, mirrored, num_traversed, meet_fwd != -1
+
+def astar_bidirectional(M_total, C_total, start_state, goal_state, boat_capacity):
+    """
+    Bidirectional A* search from start_state and goal_state at the same time,
+    meeting in the middle. Same contract as astar_search.
+    Returns:
+      path: The sequence of states from start to goal.
+      num_traversed: Number of states traversed (popped from both open lists).
+    """
+    M_left, C_left, boat_bit = start_state
+    if not (0 <= M_left <= M_total and 0 <= C_left <= C_total):
+        return None, 0
+
+    start = pack_state(start_state, C_total)
+    goal = pack_state(goal_state, C_total)
+    # Like astar_search, a start that already is the goal is returned as is
+    if start == goal:
+        return [start_state], 1
+
+    # The backward search starts from the goal, so it must be a legal state itself
+    if not is_valid_state(goal_state[0], goal_state[1], M_total, C_total):
+        return None, 0
+    parent, meet_fwd, meet_bwd, mirrored, num_traversed, found = _astar_bidirectional_numba(
+        M_total, C_total, boat_capacity, start, goal, get_move_array(boat_capacity))
+    if not found:
+        return None, num_traversed
+    last = parent.shape[1] - 1
+
+    def next_towards_goal(idx):
+        # Backward-tree parent; a mirrored tree is read through the forward one
+        if not mirrored:
+            return int(parent[1, idx])
+        prev = int(parent[0, last - idx])
+        return -1 if prev == -1 else last - prev
+
+    # Start -> meet_fwd along the forward tree
+    path = []
+    current = int(meet_fwd)
+    while current != -1:
+        path.append(unpack_state(current, C_total))
+        current = int(parent[0, current])
+    path.reverse()
 
-    return None, num_traversed
+    # meet_bwd -> goal along the backward tree
+    current = int(meet_bwd)
+    if meet_bwd == meet_fwd:
+        current = next_towards_goal(current)
+    while current != -1:
+        path.append(unpack_state(current, C_total))
+        current = next_towards_goal(current)
+    return path, num_traversed
 
 def solve_missionaries_cannibals(M_total=3, C_total=3, boat_capacity=2, 
-                                M_left=None, C_left=None, M_right=None, C_right=None, boat_position='left'):
+                                M_left=None, C_left=None, M_right=None, C_right=None, boat_position='left',
+                                bidirectional=False):
     """
-    Solve the missionaries and cannibals problem using A* search.
+    Solve the missionaries and cannibals problem using A* search
+    (bidirectional A* if bidirectional is set).
+    The right bank is derived from the totals, so M_right/C_right are only
+    kept for call compatibility with the other solvers.
     
     Returns:
       {
@@ -124,27 +524,24 @@ def solve_missionaries_cannibals(M_total=3, C_total=3, boat_capacity=2,
         M_left = M_total
     if C_left is None:
         C_left = C_total
-    if M_right is None:
-        M_right = 0
-    if C_right is None:
-        C_right = 0
     
-    start_state = (M_left, C_left, M_right, C_right, boat_position)
-    goal_state = (0, 0, M_total, C_total, 'right')
+    start_state = (M_left, C_left, 0 if boat_position == 'left' else 1)
+    goal_state = (0, 0, 1)
     
-    solution_path, num_traversed = astar_search(M_total, C_total, start_state, goal_state, boat_capacity)
+    search = astar_bidirectional if bidirectional else astar_search
+    solution_path, num_traversed = search(M_total, C_total, start_state, goal_state, boat_capacity)
     if solution_path is None:
         print("No solution found.")
         return {"output": None, "number_of_states": num_traversed, "N": M_total}
     
     output = {}
-    for i, (Ml, Cl, Mr, Cr, bp) in enumerate(solution_path):
+    for i, (Ml, Cl, boat_bit) in enumerate(solution_path):
         output[str(i)] = {
             'M_left': Ml,
             'C_left': Cl,
-            'M_right': Mr,
-            'C_right': Cr,
-            'boat_position': bp
+            'M_right': M_total - Ml,
+            'C_right': C_total - Cl,
+            'boat_position': BOAT_SIDES[boat_bit]
         }
     return {"output": output, "number_of_states": num_traversed, "N": M_total}
 
@@ -0,0 +1,141 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython build of the one-directional A* kernel (_astar_numba in
+missionary_cannibal_a_star.py), for interpreters without numba such as PyPy.
+Same arguments, same results; missionary_cannibal_a_star uses it when built.
+
+Build in place:
+    cythonize -i missionary_cannibal_a_star_kernel.pyx
+"""
+from libc.stdlib cimport free, malloc, realloc
+
+cdef struct Entry:
+    int next
+    int g
+    int idx
+
+def astar_kernel(int M_total, int C_total, int boat_capacity, int start_idx, int goal_idx,
+                 const int[:, ::1] moves_arr, unsigned char[::1] visited, int[::1] parent,
+                 int[::1] g_cost):
+    """
+    A* over dense state indices with a FIFO bucket queue, as in _astar_numba.
+    visited, parent and g_cost are caller-owned buffers of num_states
+    entries, initialised to 0, -1 and INT32_MAX; parent receives the parent
+    index of every reached state.
+    Returns:
+      num_traversed: Number of states popped from the open list.
+      found: Whether goal_idx was reached.
+    """
+    cdef int num_states = (M_total + 1) * (C_total + 1) * 2
+    cdef int stride = C_total + 1
+    cdef int num_moves = moves_arr.shape[0]
+    # Every expanded state has g < num_states, so f never exceeds f_max
+    cdef int f_max = num_states + (M_total + C_total + 1) // 2
+    cdef Py_ssize_t capacity = num_states
+    cdef Py_ssize_t num_entries, num_open, entry
+    cdef long num_traversed = 0
+    cdef int k, f, g, min_f, current, nxt, boat_bit, sign, tentative_g
+    cdef int M_left, C_left, new_M_left, new_C_left, new_M_right
+    cdef Entry *grown
+
+    cdef int *bucket_head = <int *> malloc((f_max + 1) * sizeof(int))
+    cdef int *bucket_tail = <int *> malloc((f_max + 1) * sizeof(int))
+    cdef int *index_steps = <int *> malloc(num_moves * sizeof(int))
+    cdef Entry *entries = <Entry *> malloc(capacity * sizeof(Entry))
+    try:
+        if not bucket_head or not bucket_tail or not index_steps or not entries:
+            raise MemoryError()
+        for f in range(f_max + 1):
+            bucket_head[f] = -1
+            bucket_tail[f] = -1
+        # A move changes the dense index by a fixed amount: boat leaving the left bank
+        # gives nxt = current - index_steps[k], leaving the right gives current + index_steps[k]
+        for k in range(num_moves):
+            index_steps[k] = (moves_arr[k, 0] * stride + moves_arr[k, 1]) * 2 - 1
+
+        M_left = (start_idx >> 1) // stride
+        C_left = (start_idx >> 1) % stride
+        min_f = (M_left + C_left + 1) >> 1
+        entries[0].next = -1
+        entries[0].g = 0
+        entries[0].idx = start_idx
+        bucket_head[min_f] = 0
+        bucket_tail[min_f] = 0
+        num_entries = 1
+        num_open = 1
+        g_cost[start_idx] = 0
+
+        while num_open > 0:
+            # Pop the oldest entry of the lowest non-empty bucket
+            while bucket_head[min_f] == -1:
+                min_f += 1
+            entry = bucket_head[min_f]
+            bucket_head[min_f] = entries[entry].next
+            num_open -= 1
+            g = entries[entry].g
+            current = entries[entry].idx
+            num_traversed += 1
+
+            if visited[current]:
+                continue
+            visited[current] = 1
+
+            if current == goal_idx:
+                return num_traversed, True
+
+            # Explore neighbors
+            boat_bit = current & 1
+            M_left = (current >> 1) // stride
+            C_left = (current >> 1) % stride
+            sign = 1 if boat_bit else -1
+            tentative_g = g + 1
+            for k in range(num_moves):
+                new_M_left = M_left + sign * moves_arr[k, 0]
+                new_C_left = C_left + sign * moves_arr[k, 1]
+                if new_M_left < 0 or new_C_left < 0 or new_M_left > M_total or new_C_left > C_total:
+                    continue
+                if new_M_left != 0 and new_C_left > new_M_left:
+                    continue
+                new_M_right = M_total - new_M_left
+                if new_M_right != 0 and C_total - new_C_left > new_M_right:
+                    continue
+                nxt = current + sign * index_steps[k]
+                if visited[nxt] or tentative_g >= g_cost[nxt]:
+                    continue
+                g_cost[nxt] = tentative_g
+                parent[nxt] = current
+                if nxt == goal_idx:
+                    # Stop at generation instead of waiting to pop the goal. This is only
+                    # guaranteed shortest while h never overestimates, i.e. boat_capacity <= 2;
+                    # for larger boats ceil(people_left / 2) can overestimate, exactly as for
+                    # the pop-time goal test
+                    return num_traversed, True
+                f = tentative_g + ((new_M_left + new_C_left + 1) >> 1)
+
+                # Append to bucket f
+                if num_entries == capacity:
+                    grown = <Entry *> realloc(entries, 2 * capacity * sizeof(Entry))
+                    if not grown:
+                        raise MemoryError()
+                    entries = grown
+                    capacity *= 2
+                entries[num_entries].next = -1
+                entries[num_entries].g = tentative_g
+                entries[num_entries].idx = nxt
+                if bucket_head[f] == -1:
+                    bucket_head[f] = num_entries
+                else:
+                    entries[bucket_tail[f]].next = num_entries
+                bucket_tail[f] = num_entries
+                num_entries += 1
+                num_open += 1
+                # h is not consistent for boat_capacity > 2, so f can drop below the cursor
+                if f < min_f:
+                    min_f = f
+
+        return num_traversed, False
+    finally:
+        free(bucket_head)
+        free(bucket_tail)
+        free(index_steps)
+        free(entries)
@@ -0,0 +1,31 @@
+import pytest
+
+from app import app
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+@pytest.mark.parametrize("solver", ["bfs", "dfs", "a_star"])
+def test_jealous_husband_null_banks_use_defaults(client, solver):
+    response = client.post("/jealous-husband", json={
+        "num_of_couples": 2,
+        "boat_capacity": 2,
+        "solver": solver,
+        "stage": {"left_bank": None, "right_bank": None, "boat_position": "L"},
+    })
+    assert response.status_code == 200
+    assert response.get_json()["output"] is not None
+
+
+def test_missionary_cannibal_unhashable_parameter_is_solved_uncached(client):
+    # a_star derives the right bank from the totals, so M_right/C_right are not used
+    response = client.post("/missionary-cannibal", json={
+        "M_total": 3, "C_total": 3, "boat_capacity": 2,
+        "M_left": 3, "C_left": 3, "M_right": [0], "C_right": {"count": 0},
+        "boat_position": "left", "solver": "a_star",
+    })
+    assert response.status_code == 200
+    assert len(response.get_json()["output"]) == 12
@@ -0,0 +1,118 @@
+import contextlib
+import io
+
+import pytest
+
+import missionary_cannibal_a_star
+import missionary_cannibal_solver_bfs
+
+
+def solve_quietly(module, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return module.solve_missionaries_cannibals(*args, **kwargs)
+
+
+def assert_legal_path(output, M_total, C_total, boat_capacity):
+    steps = [output[str(i)] for i in range(len(output))]
+    for step in steps:
+        assert missionary_cannibal_a_star.is_valid_state(step["M_left"], step["C_left"], M_total, C_total), step
+    for before, after in zip(steps, steps[1:]):
+        # The boat crosses every step, carrying 1..boat_capacity people away from its bank
+        assert before["boat_position"] != after["boat_position"], (before, after)
+        sign = 1 if before["boat_position"] == "left" else -1
+        moved_M = sign * (before["M_left"] - after["M_left"])
+        moved_C = sign * (before["C_left"] - after["C_left"])
+        assert moved_M >= 0 and moved_C >= 0 and 0 < moved_M + moved_C <= boat_capacity, (before, after)
+
+
+@pytest.mark.parametrize("bidirectional", [False, True])
+def test_matches_bfs_solvability_and_length(bidirectional):
+    for M_total in range(0, 7):
+        for C_total in range(0, 7):
+            for boat_capacity in range(0, 5):
+                args = (M_total, C_total, boat_capacity)
+                expected = solve_quietly(missionary_cannibal_solver_bfs, *args)["output"]
+                result = solve_quietly(missionary_cannibal_a_star, *args, bidirectional=bidirectional)["output"]
+                assert (result is None) == (expected is None), args
+                if result is None:
+                    continue
+                assert len(result) == len(expected), args
+                assert_legal_path(result, *args)
+
+
+@pytest.mark.parametrize("bidirectional", [False, True])
+def test_matches_bfs_from_every_start(bidirectional):
+    # Any start other than everyone on the left is not the mirror of the goal,
+    # so bidirectional A* expands both directions and joins two search trees
+    M_total, C_total, boat_capacity = 3, 3, 2
+    for M_left in range(M_total + 1):
+        for C_left in range(C_total + 1):
+            if not missionary_cannibal_a_star.is_valid_state(M_left, C_left, M_total, C_total):
+                continue
+            for boat_position in ("left", "right"):
+                args = (M_total, C_total, boat_capacity, M_left, C_left, M_total - M_left, C_total - C_left, boat_position)
+                expected = solve_quietly(missionary_cannibal_solver_bfs, *args)["output"]
+                result = solve_quietly(missionary_cannibal_a_star, *args, bidirectional=bidirectional)["output"]
+                assert (result is None) == (expected is None), args
+                if result is None:
+                    continue
+                assert len(result) == len(expected), args
+                assert result["0"]["M_left"] == M_left and result["0"]["C_left"] == C_left, args
+                assert result["0"]["boat_position"] == boat_position, args
+                assert_legal_path(result, M_total, C_total, boat_capacity)
+
+
+def test_bidirectional_joins_two_search_trees():
+    A = missionary_cannibal_a_star
+    _, meet_fwd, meet_bwd, mirrored, _, found = A._astar_bidirectional_numba(
+        3, 3, 2, A.pack_state((1, 1, 1), 3), A.pack_state((0, 0, 1), 3), A.get_move_array(2))
+    # Two real search trees that meet across an edge, not a mirrored single tree
+    assert found and not mirrored and meet_fwd != meet_bwd
+
+    result = solve_quietly(missionary_cannibal_a_star, 3, 3, 2, M_left=1, C_left=1, M_right=2, C_right=2,
+                           boat_position="right", bidirectional=True)["output"]
+    expected = solve_quietly(missionary_cannibal_solver_bfs, 3, 3, 2, 1, 1, 2, 2, "right")["output"]
+    assert len(result) == len(expected)
+    assert_legal_path(result, 3, 3, 2)
+
+
+@pytest.mark.parametrize("bidirectional", [False, True])
+def test_unsafe_goal_has_no_solution(bidirectional):
+    # 2 missionaries and 3 cannibals all on the right bank is unsafe
+    result = solve_quietly(missionary_cannibal_a_star, 2, 3, 3, bidirectional=bidirectional)
+    assert result["output"] is None
+
+
+@pytest.mark.parametrize("bidirectional", [False, True])
+def test_start_is_goal(bidirectional):
+    result = solve_quietly(missionary_cannibal_a_star, 2, 2, 0, M_left=0, C_left=0, boat_position="right",
+                           bidirectional=bidirectional)
+    assert result["output"] == {"0": {"M_left": 0, "C_left": 0, "M_right": 2, "C_right": 2, "boat_position": "right"}}
+    assert result["number_of_states"] == 1
+
+
+@pytest.mark.parametrize("bidirectional", [False, True])
+def test_start_is_unsafe_goal(bidirectional):
+    # Everyone already across, even though 1 missionary with 2 cannibals is unsafe
+    result = solve_quietly(missionary_cannibal_a_star, 1, 2, 2, M_left=0, C_left=0, boat_position="right",
+                           bidirectional=bidirectional)
+    assert result["output"] == {"0": {"M_left": 0, "C_left": 0, "M_right": 1, "C_right": 2, "boat_position": "right"}}
+
+
+def test_get_next_states_matches_kernel_successors():
+    # The kernel stops as soon as it generates the goal, so a search from s to t
+    # returns the two-state path exactly when t is one of s's successors
+    A = missionary_cannibal_a_star
+    for M_total in range(0, 4):
+        for C_total in range(0, 4):
+            states = [(M_left, C_left, boat_bit)
+                      for M_left in range(M_total + 1) for C_left in range(C_total + 1) for boat_bit in (0, 1)
+                      if A.is_valid_state(M_left, C_left, M_total, C_total)]
+            for boat_capacity in range(0, 4):
+                for state in states:
+                    expected = {target for target in states
+                                if target != state
+                                and len(A.astar_search(M_total, C_total, state, target, boat_capacity)[0] or ()) == 2}
+                    next_states = A.get_next_states(state, M_total, C_total, boat_capacity)
+                    assert len(next_states) == len(set(next_states)), (M_total, C_total, boat_capacity, state)
+                    assert set(next_states) == expected, (M_total, C_total, boat_capacity, state)